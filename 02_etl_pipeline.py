@@ -15,10 +15,14 @@ Date: 2024
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import json
 import sqlite3
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import warnings
@@ -35,21 +39,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class DataCleaner:
-    """Handles data cleaning operations for all datasets."""
-    
-    def __init__(self):
-        self.cleaning_stats = {}
-    
-    def clean_customers_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and normalize customers data."""
-        logger.info("Starting customers data cleaning...")
-        
-        # Create a copy to avoid modifying original
-        cleaned_df = df.copy()
-        
-        # 1. Merge redundant fields
-        cleaned_df = self._merge_redundant_fields(cleaned_df, {
+# Fallback format for the non-ISO dates found in the raw exports
+US_DATE_FORMAT = '%m/%d/%Y'
+
+# String placeholders treated as missing values in object columns
+NULL_VARIANTS = ['null', 'NULL', 'N/A', 'NA', '', 'nan', 'NaN']
+
+# Explicit Arrow column types for the CSV exports; dates stay strings for DataCleaner to parse
+ORDERS_CSV_TYPES = {
+    'quantity': pa.int64(), 'qty': pa.int64(),
+    'unit_price': pa.float64(), 'price': pa.float64(),
+    'total_amount': pa.float64(), 'order_total': pa.float64(),
+    'shipping_cost': pa.float64(), 'tax': pa.float64(), 'discount': pa.float64(),
+    'order_date': pa.string(), 'order_datetime': pa.string()
+}
+RECONCILIATION_CSV_TYPES = {
+    'amount_paid': pa.float64(), 'quantity_ordered': pa.int64(),
+    'unit_cost': pa.float64(), 'total_value': pa.float64(),
+    'discount_applied': pa.float64(), 'shipping_fee': pa.float64(), 'tax_amount': pa.float64(),
+    'transaction_date': pa.string(), 'last_modified_timestamp': pa.string()
+}
+
+# Raw export for each dataset
+RAW_DATA_FILES = {
+    'customers': 'customers_messy_data.json',
+    'orders': 'orders_unstructured_data.csv',
+    'products': 'products_inconsistent_data.json',
+    'reconciliation': 'reconciliation_challenge_data.csv'
+}
+
+# strptime formats tried in order by the Polars cleaner, matching DataCleaner._parse_dates
+POLARS_DATE_FORMATS = ['%Y-%m-%dT%H:%M:%S%.fZ', '%Y-%m-%dT%H:%M:%S%.f', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d', US_DATE_FORMAT]
+
+# Declarative cleaning rules per dataset, applied in order by DataCleaner.clean_dataset:
+# merge redundant fields, coerce types, normalize categoricals, handle missing
+# values, remove duplicates and dictionary-encode IDs
+CLEAN_SPEC = {
+    'customers': {
+        'merge': {
             'email': ['email', 'email_address'],
             'phone': ['phone', 'phone_number'],
             'customer_id': ['customer_id', 'cust_id'],
@@ -57,31 +84,29 @@ class DataCleaner:
             'zip_code': ['zip_code', 'postal_code'],
             'registration_date': ['registration_date', 'reg_date'],
             'status': ['status', 'customer_status']
-        })
-        
-        # 2. Clean and standardize data types
-        cleaned_df = self._standardize_customer_data_types(cleaned_df)
-        
-        # 3. Normalize categorical fields
-        cleaned_df = self._normalize_customer_categoricals(cleaned_df)
-        
-        # 4. Handle missing values
-        cleaned_df = self._handle_customer_missing_values(cleaned_df)
-        
-        # 5. Remove duplicates
-        cleaned_df = self._remove_customer_duplicates(cleaned_df)
-        
-        logger.info(f"Customers cleaning completed. Final shape: {cleaned_df.shape}")
-        return cleaned_df
-    
-    def clean_orders_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and normalize orders data."""
-        logger.info("Starting orders data cleaning...")
-        
-        cleaned_df = df.copy()
-        
-        # 1. Merge redundant fields
-        cleaned_df = self._merge_redundant_fields(cleaned_df, {
+        },
+        'numeric': ['total_spent', 'total_orders', 'loyalty_points', 'age'],
+        'dates': ['registration_date', 'birth_date'],
+        'categoricals': {
+            'status': ({
+                'active': 'active', 'inactive': 'inactive', 'suspended': 'suspended',
+                'act': 'active', 'inact': 'inactive', 'sus': 'suspended'
+            }, 'inactive'),
+            'gender': ({
+                'male': 'male', 'female': 'female', 'other': 'other',
+                'm': 'male', 'f': 'female', 'o': 'other'
+            }, 'other'),
+            'segment': ({
+                'regular': 'regular', 'vip': 'vip', 'new': 'new',
+                'reg': 'regular', 'premium': 'vip'
+            }, 'regular')
+        },
+        # Impute with the median only when it falls inside the given range
+        'median_fill': {'age': (18, 80)},
+        'dedup_keys': ['email', 'customer_id']
+    },
+    'orders': {
+        'merge': {
             'order_id': ['order_id', 'ord_id'],
             'customer_id': ['customer_id', 'cust_id'],
             'product_id': ['product_id', 'item_id'],
@@ -89,367 +114,313 @@ class DataCleaner:
             'unit_price': ['unit_price', 'price'],
             'total_amount': ['total_amount', 'order_total'],
             'status': ['status', 'order_status']
-        })
-        
-        # 2. Clean and standardize data types
-        cleaned_df = self._standardize_orders_data_types(cleaned_df)
-        
-        # 3. Normalize categorical fields
-        cleaned_df = self._normalize_orders_categoricals(cleaned_df)
-        
-        # 4. Handle missing values
-        cleaned_df = self._handle_orders_missing_values(cleaned_df)
-        
-        # 5. Remove duplicates
-        cleaned_df = self._remove_orders_duplicates(cleaned_df)
-        
-        logger.info(f"Orders cleaning completed. Final shape: {cleaned_df.shape}")
-        return cleaned_df
-    
-    def clean_products_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and normalize products data."""
-        logger.info("Starting products data cleaning...")
-        
-        cleaned_df = df.copy()
-        
-        # 1. Merge redundant fields
-        cleaned_df = self._merge_redundant_fields(cleaned_df, {
+        },
+        'numeric': ['quantity', 'unit_price', 'total_amount', 'shipping_cost', 'tax', 'discount'],
+        'dates': ['order_date', 'order_datetime'],
+        'categoricals': {
+            'status': ({
+                'pending': 'pending', 'processing': 'processing', 'shipped': 'shipped',
+                'delivered': 'delivered', 'cancelled': 'cancelled', 'returned': 'returned',
+                'pend': 'pending', 'proc': 'processing', 'ship': 'shipped',
+                'deliv': 'delivered', 'cancel': 'cancelled', 'ret': 'returned'
+            }, 'pending'),
+            'payment_method': ({
+                'credit_card': 'credit_card', 'debit_card': 'debit_card', 'paypal': 'paypal',
+                'bank_transfer': 'bank_transfer', 'cash': 'cash',
+                'credit': 'credit_card', 'debit': 'debit_card', 'transfer': 'bank_transfer'
+            }, 'credit_card')
+        },
+        'fillna': {'quantity': 1},
+        'dedup_keys': ['order_id'],
+        'encode_ids': True
+    },
+    'products': {
+        'merge': {
             'product_id': ['product_id', 'item_id'],
             'product_name': ['product_name', 'item_name'],
             'category': ['category', 'product_category'],
             'brand': ['brand', 'manufacturer'],
             'price': ['price', 'list_price'],
             'stock_quantity': ['stock_quantity', 'stock_level']
-        })
-        
-        # 2. Clean and standardize data types
-        cleaned_df = self._standardize_products_data_types(cleaned_df)
-        
-        # 3. Normalize categorical fields
-        cleaned_df = self._normalize_products_categoricals(cleaned_df)
-        
-        # 4. Handle missing values
-        cleaned_df = self._handle_products_missing_values(cleaned_df)
-        
-        # 5. Remove duplicates
-        cleaned_df = self._remove_products_duplicates(cleaned_df)
-        
-        logger.info(f"Products cleaning completed. Final shape: {cleaned_df.shape}")
-        return cleaned_df
+        },
+        'numeric': ['price', 'cost', 'weight', 'stock_quantity', 'reorder_level', 'rating'],
+        # Values not listed as truthy become False
+        'booleans': {'is_active': [True, 1, 'yes', 'true', '1']},
+        'dates': ['created_date', 'last_updated'],
+        'categoricals': {
+            'category': ({
+                'electronics': 'electronics', 'clothing': 'clothing', 'books': 'books',
+                'sports': 'sports', 'toys': 'toys', 'home': 'home',
+                'elec': 'electronics', 'cloth': 'clothing', 'book': 'books',
+                'sport': 'sports', 'toy': 'toys'
+            }, 'other')
+        },
+        'lowercase': ['brand'],
+        'fillna': {'stock_quantity': 0, 'is_active': True},
+        'dedup_keys': ['product_id'],
+        'encode_ids': True
+    },
+    'reconciliation': {
+        'numeric': ['amount_paid', 'quantity_ordered', 'unit_cost', 'total_value',
+                    'discount_applied', 'shipping_fee', 'tax_amount'],
+        'dates': ['transaction_date', 'last_modified_timestamp'],
+        'categoricals': {
+            'payment_status': ({
+                'completed': 'completed', 'pending': 'pending', 'failed': 'failed',
+                'complete': 'completed', 'pend': 'pending', 'fail': 'failed'
+            }, 'pending'),
+            'delivery_status': ({
+                'pending': 'pending', 'in_transit': 'in_transit', 'delivered': 'delivered',
+                'pend': 'pending', 'transit': 'in_transit', 'deliv': 'delivered'
+            }, 'pending')
+        }
+    }
+}
+
+class DataCleaner:
+    """Handles data cleaning operations for all datasets.
+    
+    Each dataset is cleaned by one driver, clean_dataset, following its
+    CLEAN_SPEC entry. The clean_* methods work on the frame they are given
+    rather than a copy.
+    """
+    
+    def __init__(self):
+        self.cleaning_stats = {}
+    
+    def clean_customers_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and normalize customers data."""
+        return self.clean_dataset('customers', df)
+    
+    def clean_orders_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and normalize orders data."""
+        return self.clean_dataset('orders', df)
+    
+    def clean_products_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and normalize products data."""
+        return self.clean_dataset('products', df)
     
     def clean_reconciliation_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and normalize reconciliation data."""
-        logger.info("Starting reconciliation data cleaning...")
-        
-        cleaned_df = df.copy()
-        
-        # 1. Clean and standardize data types
-        cleaned_df = self._standardize_reconciliation_data_types(cleaned_df)
-        
-        # 2. Normalize categorical fields
-        cleaned_df = self._normalize_reconciliation_categoricals(cleaned_df)
-        
-        # 3. Handle missing values
-        cleaned_df = self._handle_reconciliation_missing_values(cleaned_df)
-        
-        # 4. Remove duplicates
-        cleaned_df = self._remove_reconciliation_duplicates(cleaned_df)
-        
-        logger.info(f"Reconciliation cleaning completed. Final shape: {cleaned_df.shape}")
-        return cleaned_df
-    
-    def _merge_redundant_fields(self, df: pd.DataFrame, field_mappings: Dict[str, List[str]]) -> pd.DataFrame:
-        """Merge redundant fields with priority logic."""
-        for target_field, source_fields in field_mappings.items():
-            if target_field not in df.columns:
-                # Find the first available source field
-                for source_field in source_fields:
-                    if source_field in df.columns:
-                        df[target_field] = df[source_field]
-                        break
-            else:
-                # Merge with priority logic
-                for source_field in source_fields:
-                    if source_field in df.columns and source_field != target_field:
-                        # Fill missing values in target with non-null values from source
-                        mask = df[target_field].isna() & df[source_field].notna()
-                        df.loc[mask, target_field] = df.loc[mask, source_field]
-        
-        return df
+        return self.clean_dataset('reconciliation', df)
     
-    def _standardize_customer_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize data types for customers data."""
-        # Convert total_spent to float
-        if 'total_spent' in df.columns:
-            df['total_spent'] = pd.to_numeric(df['total_spent'], errors='coerce')
+    def clean_dataset(self, name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean a dataset according to its CLEAN_SPEC entry."""
+        logger.info(f"Starting {name} data cleaning...")
+        spec = CLEAN_SPEC[name]
         
-        # Convert numeric fields
-        numeric_fields = ['total_orders', 'loyalty_points', 'age']
-        for field in numeric_fields:
-            if field in df.columns:
-                df[field] = pd.to_numeric(df[field], errors='coerce')
+        # 1. Merge redundant fields
+        df = self._merge_redundant_fields(df, spec.get('merge', {}))
         
-        # Convert date fields
-        date_fields = ['registration_date', 'birth_date']
-        for field in date_fields:
+        # 2. Clean and standardize data types
+        df = self._coerce_numeric(df, spec.get('numeric', []))
+        for field, truthy_values in spec.get('booleans', {}).items():
             if field in df.columns:
-                df[field] = pd.to_datetime(df[field], errors='coerce')
+                df[field] = df[field].isin(truthy_values)
+        df = self._coerce_dates(df, spec.get('dates', []))
         
-        return df
-    
-    def _standardize_orders_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize data types for orders data."""
-        # Convert numeric fields
-        numeric_fields = ['quantity', 'unit_price', 'total_amount', 'shipping_cost', 'tax', 'discount']
-        for field in numeric_fields:
+        # 3. Normalize categorical fields
+        for field, (mapping, default) in spec.get('categoricals', {}).items():
             if field in df.columns:
-                df[field] = pd.to_numeric(df[field], errors='coerce')
-        
-        # Convert date fields
-        date_fields = ['order_date', 'order_datetime']
-        for field in date_fields:
+                df[field] = self._map_categorical(df[field], mapping, default)
+        for field in spec.get('lowercase', []):
             if field in df.columns:
-                df[field] = pd.to_datetime(df[field], errors='coerce')
+                df[field] = self._lower_strings(df[field], strip=True).to_numpy(zero_copy_only=False)
         
-        return df
-    
-    def _standardize_products_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize data types for products data."""
-        # Convert numeric fields
-        numeric_fields = ['price', 'cost', 'weight', 'stock_quantity', 'reorder_level', 'rating']
-        for field in numeric_fields:
-            if field in df.columns:
-                df[field] = pd.to_numeric(df[field], errors='coerce')
-        
-        # Convert boolean fields
-        if 'is_active' in df.columns:
-            df['is_active'] = df['is_active'].map({
-                True: True, False: False, 1: True, 0: False,
-                'yes': True, 'no': False, 'true': True, 'false': False,
-                '1': True, '0': False
-            }).fillna(False)
-        
-        # Convert date fields
-        date_fields = ['created_date', 'last_updated']
-        for field in date_fields:
+        # 4. Handle missing values
+        df = self._replace_null_variants(df)
+        for field, (low, high) in spec.get('median_fill', {}).items():
             if field in df.columns:
-                df[field] = pd.to_datetime(df[field], errors='coerce')
+                df = self._fill_with_median(df, field, low, high)
+        defaults = {field: value for field, value in spec.get('fillna', {}).items() if field in df.columns}
+        if defaults:
+            df = df.fillna(defaults)
         
-        return df
-    
-    def _standardize_reconciliation_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize data types for reconciliation data."""
-        # Convert numeric fields
-        numeric_fields = ['amount_paid', 'quantity_ordered', 'unit_cost', 'total_value', 
-                         'discount_applied', 'shipping_fee', 'tax_amount']
-        for field in numeric_fields:
-            if field in df.columns:
-                df[field] = pd.to_numeric(df[field], errors='coerce')
+        # 5. Remove duplicates
+        initial_count = len(df)
+        df = self._drop_duplicate_keys(df, spec.get('dedup_keys', []))
+        logger.info(f"Removed {initial_count - len(df)} duplicate {name} records")
         
-        # Convert date fields
-        date_fields = ['transaction_date', 'last_modified_timestamp']
-        for field in date_fields:
-            if field in df.columns:
-                df[field] = pd.to_datetime(df[field], errors='coerce')
+        # 6. Dictionary-encode ID columns
+        if spec.get('encode_ids'):
+            df = self._encode_id_columns(df)
         
+        logger.info(f"{name.capitalize()} cleaning completed. Final shape: {df.shape}")
         return df
     
-    def _normalize_customer_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize categorical fields for customers."""
-        # Normalize status
-        if 'status' in df.columns:
-            df['status'] = df['status'].str.lower().map({
-                'active': 'active', 'inactive': 'inactive', 'suspended': 'suspended',
-                'act': 'active', 'inact': 'inactive', 'sus': 'suspended'
-            }).fillna('inactive')
+    def clean_with_polars(self, name: str, path: str) -> 'pl.LazyFrame':
+        """Build a lazy Polars query that cleans a raw file according to its CLEAN_SPEC entry.
         
-        # Normalize gender
-        if 'gender' in df.columns:
-            df['gender'] = df['gender'].str.lower().map({
-                'male': 'male', 'female': 'female', 'other': 'other',
-                'm': 'male', 'f': 'female', 'o': 'other'
-            }).fillna('other')
-        
-        # Normalize segment
-        if 'segment' in df.columns:
-            df['segment'] = df['segment'].str.lower().map({
-                'regular': 'regular', 'vip': 'vip', 'new': 'new',
-                'reg': 'regular', 'premium': 'vip'
-            }).fillna('regular')
+        All columns are scanned as strings and every step is expressed as a
+        Polars expression, so the whole cleaning runs as one fused query plan
+        when the frame is collected. Requires the optional polars package.
+        """
+        import polars as pl
         
-        return df
-    
-    def _normalize_orders_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize categorical fields for orders."""
-        # Normalize status
-        if 'status' in df.columns:
-            df['status'] = df['status'].str.lower().map({
-                'pending': 'pending', 'processing': 'processing', 'shipped': 'shipped',
-                'delivered': 'delivered', 'cancelled': 'cancelled', 'returned': 'returned',
-                'pend': 'pending', 'proc': 'processing', 'ship': 'shipped',
-                'deliv': 'delivered', 'cancel': 'cancelled', 'ret': 'returned'
-            }).fillna('pending')
+        if path.endswith('.csv'):
+            lf = pl.scan_csv(path, infer_schema=False)
+        else:
+            # The raw JSON files are arrays rather than NDJSON, so they cannot be scanned
+            lf = pl.read_json(path, infer_schema_length=None).lazy()
+            lf = lf.with_columns(pl.all().cast(pl.String))
+        spec = CLEAN_SPEC[name]
+        columns = set(lf.collect_schema().names())
         
-        # Normalize payment method
-        if 'payment_method' in df.columns:
-            df['payment_method'] = df['payment_method'].str.lower().map({
-                'credit_card': 'credit_card', 'debit_card': 'debit_card', 'paypal': 'paypal',
-                'bank_transfer': 'bank_transfer', 'cash': 'cash',
-                'credit': 'credit_card', 'debit': 'debit_card', 'transfer': 'bank_transfer'
-            }).fillna('credit_card')
+        # 1. Merge redundant fields
+        merged = []
+        for target, sources in spec.get('merge', {}).items():
+            available = [field for field in [target] + sources if field in columns]
+            if available:
+                merged.append(pl.coalesce(available).alias(target))
+        lf = lf.with_columns(merged)
+        columns |= set(spec.get('merge', {}))
         
-        return df
-    
-    def _normalize_products_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize categorical fields for products."""
-        # Normalize category
-        if 'category' in df.columns:
-            df['category'] = df['category'].str.lower().map({
-                'electronics': 'electronics', 'clothing': 'clothing', 'books': 'books',
-                'sports': 'sports', 'toys': 'toys', 'home': 'home',
-                'elec': 'electronics', 'cloth': 'clothing', 'book': 'books',
-                'sport': 'sports', 'toy': 'toys'
-            }).fillna('other')
+        def present(fields):
+            return [field for field in fields if field in columns]
         
-        # Normalize brand
-        if 'brand' in df.columns:
-            df['brand'] = df['brand'].str.lower().str.strip()
+        # 2. Clean and standardize data types
+        exprs = [pl.col(field).cast(pl.Float64, strict=False) for field in present(spec.get('numeric', []))]
+        for field, truthy_values in spec.get('booleans', {}).items():
+            if field in columns:
+                truthy = ['true' if value is True else str(value) for value in truthy_values]
+                exprs.append(pl.col(field).is_in(truthy).fill_null(False))
+        # pandas parses a column holding any 'Z'-suffixed value as UTC and then skips the
+        # US-style fallback; check the raw strings up front so both paths return the same dtypes
+        date_fields = present(spec.get('dates', []))
+        utc_flags = lf.select([pl.col(field).str.ends_with('Z').any() for field in date_fields]).collect()
+        for field in date_fields:
+            if utc_flags[field][0]:
+                formats = [fmt for fmt in POLARS_DATE_FORMATS if fmt != US_DATE_FORMAT]
+                parsed = pl.coalesce([pl.col(field).str.strptime(pl.Datetime('ns'), fmt, strict=False)
+                                      for fmt in formats]).dt.replace_time_zone('UTC')
+            else:
+                parsed = pl.coalesce([pl.col(field).str.strptime(pl.Datetime('ns'), fmt, strict=False)
+                                      for fmt in POLARS_DATE_FORMATS])
+            exprs.append(parsed)
         
-        return df
-    
-    def _normalize_reconciliation_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize categorical fields for reconciliation data."""
-        # Normalize payment status
-        if 'payment_status' in df.columns:
-            df['payment_status'] = df['payment_status'].str.lower().map({
-                'completed': 'completed', 'pending': 'pending', 'failed': 'failed',
-                'complete': 'completed', 'pend': 'pending', 'fail': 'failed'
-            }).fillna('pending')
+        # 3. Normalize categorical fields
+        for field, (mapping, default) in spec.get('categoricals', {}).items():
+            if field in columns:
+                exprs.append(pl.col(field).str.to_lowercase()
+                             .replace_strict(mapping, default=default, return_dtype=pl.String)
+                             .fill_null(default))
+        for field in present(spec.get('lowercase', [])):
+            exprs.append(pl.col(field).str.to_lowercase().str.strip_chars())
+        lf = lf.with_columns(exprs)
         
-        # Normalize delivery status
-        if 'delivery_status' in df.columns:
-            df['delivery_status'] = df['delivery_status'].str.lower().map({
-                'pending': 'pending', 'in_transit': 'in_transit', 'delivered': 'delivered',
-                'pend': 'pending', 'transit': 'in_transit', 'deliv': 'delivered'
-            }).fillna('pending')
+        # 4. Handle missing values
+        lf = lf.with_columns(pl.when(pl.col(pl.String).is_in(NULL_VARIANTS)).then(None).otherwise(pl.col(pl.String)).name.keep())
+        fills = []
+        for field, (low, high) in spec.get('median_fill', {}).items():
+            if field in columns:
+                median = pl.col(field).median()
+                fills.append(pl.when(pl.col(field).is_null() & median.is_between(low, high))
+                             .then(median).otherwise(pl.col(field)).alias(field))
+        fills += [pl.col(field).fill_null(value) for field, value in spec.get('fillna', {}).items() if field in columns]
+        lf = lf.with_columns(fills)
         
-        return df
-    
-    def _handle_customer_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Handle missing values in customers data."""
-        # Replace null variants with actual None
-        null_variants = ['null', 'NULL', 'N/A', 'NA', '', 'nan', 'NaN']
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].replace(null_variants, None)
+        # 5. Remove duplicates
+        keys = present(spec.get('dedup_keys', []))
+        if not keys:
+            lf = lf.unique(keep='first', maintain_order=True)
+        for key in keys:
+            lf = lf.unique(subset=[key], keep='first', maintain_order=True)
         
-        # Impute age with median if reasonable
-        if 'age' in df.columns:
-            median_age = df['age'].median()
-            if pd.notna(median_age) and 18 <= median_age <= 80:
-                df['age'] = df['age'].fillna(median_age)
+        # 6. Dictionary-encode ID columns
+        if spec.get('encode_ids'):
+            lf = lf.with_columns([pl.col(col).cast(pl.Categorical)
+                                  for col in ('product_id', 'order_id', 'customer_id') if col in columns])
         
-        return df
+        return lf
     
-    def _handle_orders_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Handle missing values in orders data."""
-        # Replace null variants
-        null_variants = ['null', 'NULL', 'N/A', 'NA', '', 'nan', 'NaN']
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].replace(null_variants, None)
-        
-        # Set default values for missing quantities
-        if 'quantity' in df.columns:
-            df['quantity'] = df['quantity'].fillna(1)
+    def _merge_redundant_fields(self, df: pd.DataFrame, field_mappings: Dict[str, List[str]]) -> pd.DataFrame:
+        """Merge redundant fields with priority logic."""
+        for target_field, source_fields in field_mappings.items():
+            available = [field for field in source_fields if field in df.columns]
+            if not available:
+                continue
+            
+            if target_field not in df.columns:
+                # Take the first available source field
+                df[target_field] = df[available[0]]
+            else:
+                # Merge with priority logic
+                for source_field in available:
+                    if source_field != target_field:
+                        # Fill missing values in target with values from source
+                        df[target_field] = df[target_field].fillna(df[source_field])
         
         return df
     
-    def _handle_products_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Handle missing values in products data."""
-        # Replace null variants
-        null_variants = ['null', 'NULL', 'N/A', 'NA', '', 'nan', 'NaN']
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].replace(null_variants, None)
-        
-        # Set default values
-        if 'stock_quantity' in df.columns:
-            df['stock_quantity'] = df['stock_quantity'].fillna(0)
-        
-        if 'is_active' in df.columns:
-            df['is_active'] = df['is_active'].fillna(True)
-        
+    def _coerce_numeric(self, df: pd.DataFrame, fields: List[str]) -> pd.DataFrame:
+        """Coerce the available numeric fields in one batched assignment."""
+        present = [field for field in fields if field in df.columns]
+        if present:
+            df[present] = df[present].apply(pd.to_numeric, errors='coerce')
         return df
     
-    def _handle_reconciliation_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Handle missing values in reconciliation data."""
-        # Replace null variants
-        null_variants = ['null', 'NULL', 'N/A', 'NA', '', 'nan', 'NaN']
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].replace(null_variants, None)
-        
+    def _coerce_dates(self, df: pd.DataFrame, fields: List[str]) -> pd.DataFrame:
+        """Parse the available date fields with explicit formats instead of per-row inference."""
+        for field in fields:
+            if field in df.columns:
+                df[field] = self._parse_dates(df[field])
         return df
     
-    def _remove_customer_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove duplicate customers based on business rules."""
-        # Remove exact duplicates
-        initial_count = len(df)
-        df = df.drop_duplicates()
-        
-        # Remove duplicates based on email (if available)
-        if 'email' in df.columns:
-            df = df.drop_duplicates(subset=['email'], keep='first')
-        
-        # Remove duplicates based on customer_id
-        if 'customer_id' in df.columns:
-            df = df.drop_duplicates(subset=['customer_id'], keep='first')
-        
-        final_count = len(df)
-        logger.info(f"Removed {initial_count - final_count} duplicate customer records")
-        
+    def _parse_dates(self, series: pd.Series) -> pd.Series:
+        """Parse ISO 8601 dates, falling back to US-style MM/DD/YYYY for the rest."""
+        parsed = pd.to_datetime(series, format='ISO8601', errors='coerce', cache=True)
+        unparsed = parsed.isna() & series.notna()
+        if unparsed.any() and parsed.dt.tz is None:
+            parsed[unparsed] = pd.to_datetime(series[unparsed], format=US_DATE_FORMAT, errors='coerce', cache=True)
+        return parsed
+    
+    def _lower_strings(self, series: pd.Series, strip: bool = False) -> pa.Array:
+        """Lower-case (and optionally trim) a column with Arrow string kernels."""
+        values = pc.utf8_lower(pa.array(series.astype('string')))
+        return pc.utf8_trim_whitespace(values) if strip else values
+    
+    def _map_categorical(self, series: pd.Series, mapping: Dict[str, str], default: str) -> pd.Series:
+        """Map lower-cased values through mapping by key position, using default for unknowns."""
+        codes = pc.index_in(self._lower_strings(series), value_set=pa.array(list(mapping)))
+        labels = np.array(list(mapping.values()) + [default], dtype=object)
+        return pd.Series(labels[codes.fill_null(len(mapping)).to_numpy()], index=series.index)
+    
+    def _replace_null_variants(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Replace null-like strings in all object columns with a single replace pass."""
+        object_columns = df.select_dtypes(include='object').columns
+        if len(object_columns) > 0:
+            df[object_columns] = df[object_columns].replace(NULL_VARIANTS, np.nan)
         return df
     
-    def _remove_orders_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove duplicate orders based on business rules."""
-        # Remove exact duplicates
-        initial_count = len(df)
-        df = df.drop_duplicates()
-        
-        # Remove duplicates based on order_id
-        if 'order_id' in df.columns:
-            df = df.drop_duplicates(subset=['order_id'], keep='first')
-        
-        final_count = len(df)
-        logger.info(f"Removed {initial_count - final_count} duplicate order records")
-        
+    def _fill_with_median(self, df: pd.DataFrame, field: str, low: float, high: float) -> pd.DataFrame:
+        """Impute a numeric field with its median if the median lies within [low, high]."""
+        values = df[field].to_numpy(dtype=np.float64, copy=True)
+        missing = np.isnan(values)
+        if missing.any() and not missing.all():
+            median = np.median(values[~missing])
+            if low <= median <= high:
+                values[missing] = median
+                df[field] = values
         return df
     
-    def _remove_products_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove duplicate products based on business rules."""
-        # Remove exact duplicates
-        initial_count = len(df)
-        df = df.drop_duplicates()
-        
-        # Remove duplicates based on product_id
-        if 'product_id' in df.columns:
-            df = df.drop_duplicates(subset=['product_id'], keep='first')
-        
-        final_count = len(df)
-        logger.info(f"Removed {initial_count - final_count} duplicate product records")
-        
+    def _encode_id_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store repeated ID columns as categoricals to shrink memory before loading."""
+        for col in ('product_id', 'order_id', 'customer_id'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         return df
     
-    def _remove_reconciliation_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove duplicate reconciliation records."""
-        # Remove exact duplicates
-        initial_count = len(df)
-        df = df.drop_duplicates()
-        
-        final_count = len(df)
-        logger.info(f"Removed {initial_count - final_count} duplicate reconciliation records")
+    def _drop_duplicate_keys(self, df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        """Drop duplicates on each available key in turn, keeping the first occurrence.
         
+        An exact duplicate always repeats an earlier row's key, so a separate
+        full-row pass is only needed when none of the keys are present.
+        """
+        present = [key for key in keys if key in df.columns]
+        if not present:
+            return df.drop_duplicates()
+        for key in present:
+            df = df.drop_duplicates(subset=[key], keep='first')
         return df
 
 class DatabaseManager:
@@ -459,25 +430,55 @@ class DatabaseManager:
         self.db_path = db_path
         self.conn = None
     
-    def create_database(self):
-        """Create the SQLite database with normalized schema."""
+    def create_schema(self):
+        """Create the SQLite database with normalized schema (tables only)."""
         logger.info(f"Creating database: {self.db_path}")
         
         self.conn = sqlite3.connect(self.db_path)
+        self._configure_bulk_load()
         
-        # Create tables with proper schema
-        self._create_customers_table()
-        self._create_products_table()
-        self._create_orders_table()
-        self._create_reconciliation_table()
-        
-        # Create indexes for performance
-        self._create_indexes()
+        # Rebuild tables from scratch so each run loads into the declared schema
+        self._run_script(self._drop_tables_ddl() + [
+            self._customers_table_ddl(),
+            self._products_table_ddl(),
+            self._orders_table_ddl(),
+            self._reconciliation_table_ddl()
+        ])
         
         logger.info("Database schema created successfully")
     
-    def _create_customers_table(self):
-        """Create customers table."""
+    def create_indexes(self):
+        """Create indexes for performance; run after loading so each B-tree is built once."""
+        self._run_script(self._index_ddl())
+        # Gather planner statistics for the new indexes
+        self.conn.execute("ANALYZE")
+        logger.info("Database indexes created successfully")
+    
+    def _run_script(self, statements: List[str]):
+        """Run DDL statements as one script inside one transaction."""
+        self.conn.executescript('BEGIN;\n' + ';\n'.join(statements) + ';\nCOMMIT;')
+    
+    def _configure_bulk_load(self):
+        """Tune the connection for a one-shot bulk load."""
+        pragmas = [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=OFF",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA cache_size=-200000"
+        ]
+        
+        for pragma in pragmas:
+            self.conn.execute(pragma)
+    
+    def _drop_tables_ddl(self) -> List[str]:
+        """DROP statements for existing tables, children before parents."""
+        return [
+            f"DROP TABLE IF EXISTS {table_name}"
+            for table_name in ['reconciliation_data', 'orders', 'products', 'customers']
+        ]
+    
+    def _customers_table_ddl(self) -> str:
+        """CREATE statement for the customers table."""
         query = """
         CREATE TABLE IF NOT EXISTS customers (
             customer_id INTEGER PRIMARY KEY,
@@ -501,10 +502,10 @@ class DatabaseManager:
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """
-        self.conn.execute(query)
+        return query.strip()
     
-    def _create_products_table(self):
-        """Create products table."""
+    def _products_table_ddl(self) -> str:
+        """CREATE statement for the products table."""
         query = """
         CREATE TABLE IF NOT EXISTS products (
             product_id VARCHAR(20) PRIMARY KEY,
@@ -528,10 +529,10 @@ class DatabaseManager:
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """
-        self.conn.execute(query)
+        return query.strip()
     
-    def _create_orders_table(self):
-        """Create orders table."""
+    def _orders_table_ddl(self) -> str:
+        """CREATE statement for the orders table."""
         query = """
         CREATE TABLE IF NOT EXISTS orders (
             order_id VARCHAR(20) PRIMARY KEY,
@@ -555,10 +556,10 @@ class DatabaseManager:
             FOREIGN KEY (product_id) REFERENCES products (product_id)
         )
         """
-        self.conn.execute(query)
+        return query.strip()
     
-    def _create_reconciliation_table(self):
-        """Create reconciliation table."""
+    def _reconciliation_table_ddl(self) -> str:
+        """CREATE statement for the reconciliation table."""
         query = """
         CREATE TABLE IF NOT EXISTS reconciliation_data (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -585,48 +586,157 @@ class DatabaseManager:
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """
-        self.conn.execute(query)
+        return query.strip()
     
-    def _create_indexes(self):
-        """Create indexes for better performance."""
+    def _index_ddl(self) -> List[str]:
+        """CREATE INDEX statements for better performance."""
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_customers_email ON customers(email)",
             "CREATE INDEX IF NOT EXISTS idx_customers_status ON customers(status)",
             "CREATE INDEX IF NOT EXISTS idx_orders_customer_id ON orders(customer_id)",
             "CREATE INDEX IF NOT EXISTS idx_orders_product_id ON orders(product_id)",
             "CREATE INDEX IF NOT EXISTS idx_orders_date ON orders(order_date)",
+            "CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)",
             "CREATE INDEX IF NOT EXISTS idx_products_category ON products(category)",
             "CREATE INDEX IF NOT EXISTS idx_products_brand ON products(brand)",
             "CREATE INDEX IF NOT EXISTS idx_reconciliation_email ON reconciliation_data(contact_email)",
             "CREATE INDEX IF NOT EXISTS idx_reconciliation_date ON reconciliation_data(transaction_date)"
         ]
         
-        for index_query in indexes:
-            self.conn.execute(index_query)
+        return indexes
     
     def load_data(self, table_name: str, df: pd.DataFrame):
         """Load data into specified table."""
+        with self.conn:
+            self._load_table(table_name, df)
+    
+    def load_tables(self, tables: Dict[str, pd.DataFrame]):
+        """Load several tables, in order, inside a single transaction."""
+        with self.conn:
+            for table_name, df in tables.items():
+                self._load_table(table_name, df)
+    
+    def _load_table(self, table_name: str, df: pd.DataFrame):
+        """Insert a table's rows without committing."""
         logger.info(f"Loading {len(df)} records into {table_name} table")
         
         try:
-            df.to_sql(table_name, self.conn, if_exists='replace', index=False)
+            self._bulk_insert(table_name, df)
             logger.info(f"Successfully loaded {len(df)} records into {table_name}")
         except Exception as e:
             logger.error(f"Error loading data into {table_name}: {str(e)}")
             raise
     
+    def _bulk_insert(self, table_name: str, df: pd.DataFrame):
+        """Insert a DataFrame into an existing table with one prepared statement."""
+        table_info = self.conn.execute(f"PRAGMA table_info({table_name})").fetchall()
+        table_columns = {row[1] for row in table_info}
+        columns = [col for col in df.columns if col in table_columns]
+        skipped = len(df.columns) - len(columns)
+        if skipped:
+            logger.info(f"Skipping {skipped} columns not in the {table_name} schema")
+        
+        rows = self._drop_invalid_rows(table_name, df[columns].copy(), table_info)
+        for col in rows.select_dtypes(include=['datetime', 'datetimetz']).columns:
+            values = rows[col]
+            if values.dt.tz is not None:
+                values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+            rows[col] = values.dt.strftime('%Y-%m-%d %H:%M:%S').astype(object).where(values.notna(), None)
+        
+        placeholders = ', '.join('?' * len(columns))
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        self.conn.executemany(query, rows.itertuples(index=False, name=None))
+    
+    def _drop_invalid_rows(self, table_name: str, rows: pd.DataFrame, table_info: List[tuple]) -> pd.DataFrame:
+        """Coerce key columns and drop rows the declared schema would reject.
+        
+        One bad row would otherwise abort the whole load: INTEGER PRIMARY KEY
+        values are coerced to integers (a 'CUST_9999' fallback becomes 9999),
+        then rows with a null key or NOT NULL column, or a repeated key, are dropped.
+        """
+        required = [name for _, name, _, notnull, _, pk in table_info if (notnull or pk) and name in rows.columns]
+        keys = [name for _, name, _, _, _, pk in table_info if pk and name in rows.columns]
+        integer_keys = [name for _, name, col_type, _, _, pk in table_info
+                        if pk and col_type.upper() == 'INTEGER' and name in rows.columns]
+        for name in integer_keys:
+            rows[name] = self._coerce_integer_key(rows[name])
+        
+        valid = rows.dropna(subset=required)
+        valid = valid.astype({name: 'int64' for name in integer_keys})
+        if keys:
+            valid = valid[~valid.duplicated(subset=keys, keep='first')]
+        if len(valid) < len(rows):
+            logger.warning(f"Dropped {len(rows) - len(valid)} {table_name} rows with a missing or duplicate key "
+                           f"or a null NOT NULL column")
+        return valid
+    
+    def _coerce_integer_key(self, values: pd.Series) -> pd.Series:
+        """Coerce IDs to whole numbers (NaN when impossible), falling back to the trailing digits of prefixed IDs."""
+        values = values.astype(object)
+        numbers = pd.to_numeric(values, errors='coerce')
+        digits = pd.to_numeric(values.astype(str).str.extract(r'(\d+)$', expand=False), errors='coerce')
+        numbers = numbers.fillna(digits.where(values.notna()))
+        # Fractional IDs cannot be an INTEGER PRIMARY KEY
+        return numbers.where(numbers % 1 == 0)
+    
     def close_connection(self):
         """Close database connection."""
         if self.conn:
             self.conn.close()
             logger.info("Database connection closed")
 
+class DuckDBManager(DatabaseManager):
+    """Loads cleaned data into DuckDB for analytical queries.
+    
+    DataFrames are registered with DuckDB and materialized with
+    CREATE TABLE ... AS SELECT, so ingestion runs in DuckDB's vectorized
+    engine instead of row-by-row inserts. Requires the optional duckdb package.
+    """
+    
+    def __init__(self, db_path: str = 'cleaned_data.duckdb'):
+        super().__init__(db_path)
+    
+    def create_schema(self):
+        """Open the DuckDB database; tables are created from the loaded DataFrames."""
+        import duckdb
+        
+        logger.info(f"Creating database: {self.db_path}")
+        self.conn = duckdb.connect(self.db_path)
+    
+    def create_indexes(self):
+        """No-op: DuckDB prunes scans with per-segment min/max zone maps instead."""
+    
+    def load_data(self, table_name: str, df: pd.DataFrame):
+        """Load data into specified table."""
+        logger.info(f"Loading {len(df)} records into {table_name} table")
+        
+        try:
+            self.conn.register('staging_df', df)
+            self.conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM staging_df")
+            self.conn.unregister('staging_df')
+            logger.info(f"Successfully loaded {len(df)} records into {table_name}")
+        except Exception as e:
+            logger.error(f"Error loading data into {table_name}: {str(e)}")
+            raise
+    
+    def load_tables(self, tables: Dict[str, pd.DataFrame]):
+        """Load several tables, in order, inside a single transaction."""
+        self.conn.begin()
+        try:
+            for table_name, df in tables.items():
+                self.load_data(table_name, df)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
 class ETLPipeline:
     """Main ETL pipeline orchestrator."""
     
-    def __init__(self):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, use_polars: bool = False):
         self.cleaner = DataCleaner()
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager or DatabaseManager()
+        self.use_polars = use_polars
         self.cleaned_data = {}
     
     def run_pipeline(self):
@@ -634,17 +744,18 @@ class ETLPipeline:
         logger.info("Starting ETL Pipeline")
         
         try:
-            # Step 1: Load raw data
-            raw_data = self._load_raw_data()
-            
-            # Step 2: Clean data
-            cleaned_data = self._clean_data(raw_data)
+            # Steps 1-2: Load and clean data
+            if self.use_polars:
+                cleaned_data = self._clean_data_with_polars()
+            else:
+                cleaned_data = self._clean_data(self._load_raw_data())
             
-            # Step 3: Create database
-            self.db_manager.create_database()
+            # Step 3: Create database schema
+            self.db_manager.create_schema()
             
-            # Step 4: Load data into database
+            # Step 4: Load data into database, then index it
             self._load_data_to_database(cleaned_data)
+            self.db_manager.create_indexes()
             
             # Step 5: Generate summary report
             self._generate_summary_report(cleaned_data)
@@ -665,9 +776,7 @@ class ETLPipeline:
         
         # Load customers data
         try:
-            with open('customers_messy_data.json', 'r') as f:
-                customers_data = json.load(f)
-            raw_data['customers'] = pd.DataFrame(customers_data)
+            raw_data['customers'] = self._read_json_records(RAW_DATA_FILES['customers'])
             logger.info(f"Loaded customers data: {raw_data['customers'].shape}")
         except Exception as e:
             logger.error(f"Error loading customers data: {str(e)}")
@@ -675,7 +784,7 @@ class ETLPipeline:
         
         # Load orders data
         try:
-            raw_data['orders'] = pd.read_csv('orders_unstructured_data.csv')
+            raw_data['orders'] = self._read_csv(RAW_DATA_FILES['orders'], ORDERS_CSV_TYPES)
             logger.info(f"Loaded orders data: {raw_data['orders'].shape}")
         except Exception as e:
             logger.error(f"Error loading orders data: {str(e)}")
@@ -683,9 +792,7 @@ class ETLPipeline:
         
         # Load products data
         try:
-            with open('products_inconsistent_data.json', 'r') as f:
-                products_data = json.load(f)
-            raw_data['products'] = pd.DataFrame(products_data)
+            raw_data['products'] = self._read_json_records(RAW_DATA_FILES['products'])
             logger.info(f"Loaded products data: {raw_data['products'].shape}")
         except Exception as e:
             logger.error(f"Error loading products data: {str(e)}")
@@ -693,7 +800,7 @@ class ETLPipeline:
         
         # Load reconciliation data
         try:
-            raw_data['reconciliation'] = pd.read_csv('reconciliation_challenge_data.csv')
+            raw_data['reconciliation'] = self._read_csv(RAW_DATA_FILES['reconciliation'], RECONCILIATION_CSV_TYPES)
             logger.info(f"Loaded reconciliation data: {raw_data['reconciliation'].shape}")
         except Exception as e:
             logger.error(f"Error loading reconciliation data: {str(e)}")
@@ -701,29 +808,62 @@ class ETLPipeline:
         
         return raw_data
     
+    def _read_csv(self, path: str, column_types: Dict[str, pa.DataType]) -> pd.DataFrame:
+        """Read a CSV with Arrow's multithreaded typed parser, falling back to pandas on unexpected values."""
+        convert_options = pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+        try:
+            return pacsv.read_csv(path, convert_options=convert_options).to_pandas()
+        except pa.ArrowInvalid as e:
+            logger.warning(f"Arrow CSV parse of {path} failed ({str(e)}); falling back to pandas")
+            return pd.read_csv(path)
+    
+    def _read_json_records(self, path: str) -> pd.DataFrame:
+        """Read a JSON array of records, releasing the parsed list as soon as the frame is built."""
+        with open(path, 'r') as f:
+            return pd.DataFrame(json.load(f))
+    
     def _clean_data(self, raw_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
         """Clean all datasets."""
         logger.info("Cleaning datasets...")
         
-        cleaned_data = {}
+        tasks = {
+            'customers': self.cleaner.clean_customers_data,
+            'orders': self.cleaner.clean_orders_data,
+            'products': self.cleaner.clean_products_data,
+            'reconciliation': self.cleaner.clean_reconciliation_data
+        }
         
-        # Clean each dataset
-        cleaned_data['customers'] = self.cleaner.clean_customers_data(raw_data['customers'])
-        cleaned_data['orders'] = self.cleaner.clean_orders_data(raw_data['orders'])
-        cleaned_data['products'] = self.cleaner.clean_products_data(raw_data['products'])
-        cleaned_data['reconciliation'] = self.cleaner.clean_reconciliation_data(raw_data['reconciliation'])
+        # The datasets are independent, so clean them in parallel processes
+        with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+            # Pop each raw frame so it is released once handed to its worker
+            futures = {name: pool.submit(clean, raw_data.pop(name)) for name, clean in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
+    def _clean_data_with_polars(self) -> Dict[str, pd.DataFrame]:
+        """Clean all datasets as lazy Polars queries, materializing them together for loading."""
+        import polars as pl
         
+        logger.info("Cleaning datasets with Polars...")
+        names = list(RAW_DATA_FILES)
+        queries = [self.cleaner.clean_with_polars(name, RAW_DATA_FILES[name]) for name in names]
+        frames = pl.collect_all(queries)
+        cleaned_data = {}
+        for name, frame in zip(names, frames):
+            cleaned_data[name] = frame.to_pandas()
+            logger.info(f"{name.capitalize()} cleaning completed. Final shape: {cleaned_data[name].shape}")
         return cleaned_data
     
     def _load_data_to_database(self, cleaned_data: Dict[str, pd.DataFrame]):
         """Load cleaned data into database."""
         logger.info("Loading data into database...")
         
-        # Load in order to respect foreign key constraints
-        self.db_manager.load_data('customers', cleaned_data['customers'])
-        self.db_manager.load_data('products', cleaned_data['products'])
-        self.db_manager.load_data('orders', cleaned_data['orders'])
-        self.db_manager.load_data('reconciliation_data', cleaned_data['reconciliation'])
+        # Load in order to respect foreign key constraints, committing once at the end
+        self.db_manager.load_tables({
+            'customers': cleaned_data['customers'],
+            'products': cleaned_data['products'],
+            'orders': cleaned_data['orders'],
+            'reconciliation_data': cleaned_data['reconciliation']
+        })
     
     def _generate_summary_report(self, cleaned_data: Dict[str, pd.DataFrame]):
         """Generate summary report of the ETL process."""
@@ -735,11 +875,12 @@ class ETLPipeline:
         }
         
         for dataset_name, df in cleaned_data.items():
+            missing_values, memory_bytes = self._null_and_byte_counts(df)
             report['datasets'][dataset_name] = {
                 'records': len(df),
                 'columns': len(df.columns),
-                'missing_values': df.isnull().sum().sum(),
-                'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024**2
+                'missing_values': missing_values,
+                'memory_usage_mb': memory_bytes / 1024**2
             }
         
         # Save report
@@ -748,6 +889,15 @@ class ETLPipeline:
         
         logger.info("Summary report saved to etl_summary_report.json")
 
+    def _null_and_byte_counts(self, df: pd.DataFrame) -> Tuple[int, int]:
+        """Count nulls and bytes from Arrow buffers instead of scanning every value."""
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            return sum(column.null_count for column in table.columns), table.nbytes
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns cannot be converted to Arrow
+            return int(df.isna().to_numpy().sum()), int(df.memory_usage(deep=True).sum())
+
 def main():
     """Main execution function."""
     try:
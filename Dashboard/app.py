@@ -1,9 +1,14 @@
 import streamlit as st
 import pandas as pd
 import sqlite3
-import plotly.express as px
+import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from plotly.colors import qualitative
 import plotly.graph_objects as go
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # Page configuration
 st.set_page_config(
@@ -33,46 +38,185 @@ st.markdown("""
 # Title
 st.markdown('<h1 class="main-header">📊 E-commerce Data Analytics Dashboard</h1>', unsafe_allow_html=True)
 
+DB_PATH = 'cleaned_data.sqlite'
+CACHE_DIR = 'cache'
+# Columns each table contributes to the dashboard
+COLUMNS = {
+    'customers': ['customer_id', 'full_name', 'email', 'phone', 'status', 'segment',
+                  'gender', 'age', 'city', 'state', 'total_spent'],
+    'orders': ['customer_id', 'product_id', 'status', 'payment_method', 'quantity', 'total_amount'],
+    'products': ['product_id', 'product_name', 'category', 'brand', 'price', 'is_active', 'stock_quantity']
+}
+
+# Layout shared by every chart
+LAYOUT = dict(margin=dict(l=20, r=20, t=40, b=20), template='plotly_white')
+
+# Rows shown per page in the data tables
+PAGE_SIZE = 100
+
+# Low-cardinality columns read straight into categoricals. age and total_spent keep SQLite's
+# float64: the ETL does not clamp or round ages, and float32 shows rounding artifacts on money
+DTYPES = {
+    'customers': {'status': 'category', 'segment': 'category', 'gender': 'category',
+                  'city': 'category', 'state': 'category'},
+    'orders': {'status': 'category', 'payment_method': 'category'},
+    'products': {'category': 'category', 'brand': 'category',
+                 # BOOLEAN affinity stores the export's 1/0 as integers next to 'yes'/'true' text
+                 'is_active': 'string'}
+}
+
+def cache_path(table):
+    """Path of the Parquet copy of a table, keyed on the columns and dtypes it is exported with"""
+    schema = repr((COLUMNS[table], sorted(DTYPES.get(table, {}).items())))
+    digest = hashlib.sha1(schema.encode()).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"{table}-{digest}.parquet")
+
+def export_table(table):
+    """Export one table from SQLite to Parquet over its own read-only connection"""
+    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    try:
+        conn.execute("PRAGMA cache_size=-200000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        df = pd.read_sql_query(
+            f"SELECT {', '.join(COLUMNS[table])} FROM {table}", conn, dtype=DTYPES.get(table)
+        )
+        df.to_parquet(cache_path(table), compression='zstd', index=False)
+    finally:
+        conn.close()
+
+def export_parquet_cache():
+    """Export every table from SQLite to Parquet, one thread per table"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(COLUMNS)) as pool:
+        list(pool.map(export_table, COLUMNS))
+    
+    # Remove copies written with an older column list
+    current = {os.path.basename(cache_path(table)) for table in COLUMNS}
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.parquet') and name not in current:
+            os.remove(os.path.join(CACHE_DIR, name))
+
+def parquet_cache_is_fresh():
+    """Check that every table has a Parquet copy newer than the database"""
+    db_mtime = os.path.getmtime(DB_PATH)
+    return all(
+        os.path.exists(cache_path(table)) and os.path.getmtime(cache_path(table)) >= db_mtime
+        for table in COLUMNS
+    )
+
+def arrow_dtype(arrow_type):
+    """Map Arrow types to Arrow-backed pandas dtypes, leaving dictionaries as categoricals"""
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+
+def read_cached_table(table):
+    """Read a cached table into Arrow-backed columns without object-dtype strings"""
+    return pq.read_table(cache_path(table), columns=COLUMNS[table]).to_pandas(types_mapper=arrow_dtype)
+
 @st.cache_data
 def load_data():
-    """Load data from SQLite database"""
+    """Load data from the Parquet cache, exporting it from SQLite when stale"""
     try:
-        conn = sqlite3.connect('cleaned_data.sqlite')
+        if not parquet_cache_is_fresh():
+            export_parquet_cache()
         
-        # Load all tables
-        customers_df = pd.read_sql_query("SELECT * FROM customers", conn)
-        orders_df = pd.read_sql_query("SELECT * FROM orders", conn)
-        products_df = pd.read_sql_query("SELECT * FROM products", conn)
-        reconciliation_df = pd.read_sql_query("SELECT * FROM reconciliation_data", conn)
-        
-        conn.close()
+        # Load all tables in parallel; pyarrow releases the GIL while decoding
+        with ThreadPoolExecutor(max_workers=len(COLUMNS)) as pool:
+            customers_df, orders_df, products_df = pool.map(read_cached_table, COLUMNS)
         
-        return customers_df, orders_df, products_df, reconciliation_df
+        return customers_df, orders_df, products_df
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
-        return None, None, None, None
+        return None, None, None
 
-def calculate_kpis(customers_df, orders_df, products_df):
-    """Calculate key performance indicators"""
-    kpis = {}
-    
-    # Customer KPIs
-    kpis['total_customers'] = len(customers_df)
-    kpis['active_customers'] = len(customers_df[customers_df['status'] == 'active'])
-    kpis['avg_customer_age'] = customers_df['age'].mean()
-    kpis['total_revenue'] = orders_df['total_amount'].sum()
-    
-    # Order KPIs
-    kpis['total_orders'] = len(orders_df)
-    kpis['avg_order_value'] = orders_df['total_amount'].mean()
-    kpis['completed_orders'] = len(orders_df[orders_df['status'] == 'delivered'])
-    
-    # Product KPIs
-    kpis['total_products'] = len(products_df)
-    kpis['active_products'] = len(products_df[products_df['is_active'] == True])
-    kpis['avg_product_price'] = products_df['price'].mean()
-    
-    return kpis
+@st.cache_data
+def load_kpis():
+    """Compute key performance indicators with SQL aggregates in SQLite"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        kpis = {}
+        
+        # Customer KPIs
+        (kpis['total_customers'], kpis['active_customers'], kpis['avg_customer_age']) = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(status = 'active'), 0), COALESCE(AVG(age), 0) FROM customers"
+        ).fetchone()
+        
+        # Order KPIs
+        (kpis['total_orders'], kpis['total_revenue'], kpis['avg_order_value'], kpis['completed_orders']) = conn.execute(
+            "SELECT COUNT(*), TOTAL(total_amount), COALESCE(AVG(total_amount), 0), COALESCE(SUM(status = 'delivered'), 0) FROM orders"
+        ).fetchone()
+        
+        # Product KPIs; is_active may hold mixed spellings ('yes', 'true', '1', 1, ...), so count each truthy one
+        (kpis['total_products'], kpis['active_products'], kpis['avg_product_price']) = conn.execute(
+            "SELECT COUNT(*), "
+            "COALESCE(SUM(CASE WHEN lower(is_active) IN ('1', 'yes', 'true') THEN 1 ELSE 0 END), 0), "
+            "COALESCE(AVG(price), 0) FROM products"
+        ).fetchone()
+        
+        return kpis
+    finally:
+        conn.close()
+
+def count_values(series):
+    """Count a categorical's values with np.bincount on its codes, most frequent first"""
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    # Leave out categories absent from the series
+    order = np.argsort(-counts, kind='stable')
+    order = order[counts[order] > 0]
+    return pd.Series(counts[order], index=series.cat.categories[order])
+
+def top_totals(codes, values, labels, n=10):
+    """Sum values per integer code with np.bincount and return the n largest totals by label"""
+    valid = codes >= 0
+    codes = codes[valid]
+    weights = values.to_numpy(dtype=float, na_value=0)[valid]
+    totals = np.bincount(codes, weights=weights, minlength=len(labels))
+    if pd.api.types.is_integer_dtype(values.dtype):
+        totals = totals.round().astype(np.int64)
+    # Only labels that occur can rank, matching a groupby over the coded rows; a full sort by
+    # (-total, code) breaks ties at the cut-off the way groupby().nlargest() does
+    present = np.flatnonzero(np.bincount(codes, minlength=len(labels)))
+    top = present[np.lexsort((present, -totals[present]))][:n]
+    return pd.Series(totals[top], index=labels[top])
+
+def pie_figure(counts, title, colors):
+    """Pie chart of pre-computed counts"""
+    return go.Figure(
+        go.Pie(
+            values=counts.values,
+            labels=counts.index,
+            marker=dict(colors=colors),
+            textposition='inside',
+            textinfo='percent+label'
+        ),
+        layout=dict(title=title, **LAYOUT)
+    )
+
+def bar_figure(labels, values, title, colorscale, xaxis_title, yaxis_title, horizontal=False):
+    """Bar chart of pre-computed values, colored by value"""
+    x, y = (values, labels) if horizontal else (labels, values)
+    return go.Figure(
+        go.Bar(
+            x=x,
+            y=y,
+            orientation='h' if horizontal else 'v',
+            marker=dict(color=values, colorscale=colorscale, showscale=True)
+        ),
+        layout=dict(title=title, xaxis_title=xaxis_title, yaxis_title=yaxis_title, **LAYOUT)
+    )
+
+def histogram_figure(series, title, color, xaxis_title, nbins=20):
+    """Bin a column with NumPy so only the bin counts are sent to the browser"""
+    counts, edges = np.histogram(series.dropna().to_numpy(), bins=nbins)
+    return go.Figure(
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            marker_color=color
+        ),
+        layout=dict(title=title, xaxis_title=xaxis_title, yaxis_title="Count", bargap=0, **LAYOUT)
+    )
 
 def create_kpi_cards(kpis):
     """Create KPI cards"""
@@ -110,215 +254,259 @@ def create_kpi_cards(kpis):
         </div>
         """, unsafe_allow_html=True)
 
-def create_customer_analysis(customers_df):
+@st.cache_data(show_spinner=False)
+def get_enriched_orders():
+    """Join orders once with the customer and product columns both order analyses need"""
+    customers_df, orders_df, products_df = load_data()
+    return orders_df.merge(
+        customers_df[['customer_id', 'segment', 'state']],
+        on='customer_id',
+        how='left'
+    ).merge(
+        products_df[['product_id', 'product_name', 'category']],
+        on='product_id',
+        how='left'
+    )
+
+def filter_customers(customers_df, selected_status, selected_segment, selected_gender, age_range):
+    """Apply the sidebar customer filters with one combined mask"""
+    ages = customers_df['age'].to_numpy(dtype=float, na_value=np.nan)
+    mask = (ages >= age_range[0]) & (ages <= age_range[1])
+    
+    if selected_status != 'All':
+        mask &= customers_df['status'].values == selected_status
+    
+    if selected_segment != 'All':
+        mask &= customers_df['segment'].values == selected_segment
+    
+    if selected_gender != 'All':
+        mask &= customers_df['gender'].values == selected_gender
+    
+    return customers_df.loc[mask]
+
+def filter_products(products_df, selected_category, price_range):
+    """Apply the sidebar product filters with one combined mask"""
+    prices = products_df['price'].to_numpy(dtype=float, na_value=np.nan)
+    mask = (prices >= price_range[0]) & (prices <= price_range[1])
+    
+    if selected_category != 'All':
+        mask &= products_df['category'].values == selected_category
+    
+    return products_df.loc[mask]
+
+@st.cache_data(show_spinner=False)
+def build_customer_figures(customer_filters):
+    """Build the customer analysis figures for a set of customer filters"""
+    customers_df = filter_customers(load_data()[0], *customer_filters)
+    figures = {}
+    
+    # Customer status distribution
+    figures['status'] = pie_figure(
+        count_values(customers_df['status']), "Customer Status Distribution", qualitative.Set3
+    )
+    
+    # Customer segment distribution
+    segment_counts = count_values(customers_df['segment'])
+    figures['segment'] = bar_figure(
+        segment_counts.index, segment_counts.values, "Customer Segment Distribution",
+        'viridis', "Segment", "Count"
+    )
+    
+    # Age distribution
+    figures['age'] = histogram_figure(customers_df['age'], "Customer Age Distribution", '#1f77b4', "Age")
+    
+    # Gender distribution
+    figures['gender'] = pie_figure(
+        count_values(customers_df['gender']), "Customer Gender Distribution", qualitative.Pastel
+    )
+    
+    return figures
+
+@st.cache_data(show_spinner=False)
+def build_order_figures(customer_filters):
+    """Build the order analysis figures for a set of customer filters"""
+    customers_df, orders_df, _ = load_data()
+    customers_df = filter_customers(customers_df, *customer_filters)
+    figures = {}
+    
+    # Keep only orders placed by the filtered customers
+    enriched_orders = get_enriched_orders()
+    customer_orders = enriched_orders.loc[enriched_orders['customer_id'].isin(customers_df['customer_id'])]
+    
+    # Order status distribution
+    figures['status'] = pie_figure(
+        count_values(orders_df['status']), "Order Status Distribution", qualitative.Set1
+    )
+    
+    # Payment method distribution
+    payment_counts = count_values(orders_df['payment_method'])
+    figures['payment'] = bar_figure(
+        payment_counts.index, payment_counts.values, "Payment Method Distribution",
+        'plasma', "Payment Method", "Count"
+    )
+    
+    # Revenue by segment
+    segment_revenue = customer_orders.groupby('segment', observed=True)['total_amount'].sum().sort_values(ascending=False)
+    figures['segment_revenue'] = bar_figure(
+        segment_revenue.index, segment_revenue.values, "Revenue by Customer Segment",
+        'viridis', "Segment", "Revenue ($)"
+    )
+    
+    # Top spending customers, one trace per segment
+    top_customers = customers_df.nlargest(10, 'total_spent')
+    figures['top_customers'] = go.Figure(
+        [
+            go.Bar(
+                x=group['total_spent'],
+                y=group['full_name'],
+                orientation='h',
+                name=str(segment),
+                marker_color=qualitative.Set3[i % len(qualitative.Set3)]
+            )
+            for i, (segment, group) in enumerate(top_customers.groupby('segment', observed=True, sort=False))
+        ],
+        layout=dict(
+            title="Top 10 Customers by Total Spent",
+            xaxis_title="Total Spent ($)",
+            yaxis_title="Customer",
+            legend_title="segment",
+            **LAYOUT
+        )
+    )
+    
+    return figures
+
+@st.cache_data(show_spinner=False)
+def build_product_figures(product_filters):
+    """Build the product analysis figures for a set of product filters"""
+    products_df = filter_products(load_data()[2], *product_filters)
+    enriched_orders = get_enriched_orders()
+    figures = {}
+    
+    # Code each order by its product's name; orders outside the filtered products get -1
+    name_codes, product_names = pd.factorize(enriched_orders['product_name'], sort=True)
+    order_codes = np.where(enriched_orders['product_id'].isin(products_df['product_id']), name_codes, -1)
+    
+    # Product category distribution
+    figures['category'] = pie_figure(
+        count_values(products_df['category']), "Product Category Distribution", qualitative.Set2
+    )
+    
+    # Product price distribution
+    figures['price'] = histogram_figure(products_df['price'], "Product Price Distribution", '#ff7f0e', "Price ($)")
+    
+    # Top selling products by quantity
+    top_products_qty = top_totals(order_codes, enriched_orders['quantity'], product_names)
+    figures['top_quantity'] = bar_figure(
+        top_products_qty.index, top_products_qty.values, "Top 10 Products by Quantity Sold",
+        'viridis', "Quantity Sold", "Product", horizontal=True
+    )
+    
+    # Top selling products by revenue
+    top_products_rev = top_totals(order_codes, enriched_orders['total_amount'], product_names)
+    figures['top_revenue'] = bar_figure(
+        top_products_rev.index, top_products_rev.values, "Top 10 Products by Revenue",
+        'plasma', "Revenue ($)", "Product", horizontal=True
+    )
+    
+    return figures
+
+@st.fragment
+def create_customer_analysis(customer_filters):
     """Create customer analysis visualizations"""
     st.subheader("👥 Customer Analysis")
+    figures = build_customer_figures(customer_filters)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        # Customer status distribution
-        status_counts = customers_df['status'].value_counts()
-        fig_status = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Customer Status Distribution",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig_status.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_status, use_container_width=True)
+        st.plotly_chart(figures['status'], key='customer_status_chart', use_container_width=True)
     
     with col2:
-        # Customer segment distribution
-        segment_counts = customers_df['segment'].value_counts()
-        fig_segment = px.bar(
-            x=segment_counts.index,
-            y=segment_counts.values,
-            title="Customer Segment Distribution",
-            color=segment_counts.values,
-            color_continuous_scale='viridis'
-        )
-        fig_segment.update_layout(xaxis_title="Segment", yaxis_title="Count")
-        st.plotly_chart(fig_segment, use_container_width=True)
+        st.plotly_chart(figures['segment'], key='customer_segment_chart', use_container_width=True)
     
     # Age distribution
     st.subheader("📊 Customer Demographics")
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_age = px.histogram(
-            customers_df,
-            x='age',
-            nbins=20,
-            title="Customer Age Distribution",
-            color_discrete_sequence=['#1f77b4']
-        )
-        fig_age.update_layout(xaxis_title="Age", yaxis_title="Count")
-        st.plotly_chart(fig_age, use_container_width=True)
+        st.plotly_chart(figures['age'], key='customer_age_chart', use_container_width=True)
     
     with col2:
-        # Gender distribution
-        gender_counts = customers_df['gender'].value_counts()
-        fig_gender = px.pie(
-            values=gender_counts.values,
-            names=gender_counts.index,
-            title="Customer Gender Distribution",
-            color_discrete_sequence=px.colors.qualitative.Pastel
-        )
-        fig_gender.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_gender, use_container_width=True)
+        st.plotly_chart(figures['gender'], key='customer_gender_chart', use_container_width=True)
 
-def create_order_analysis(orders_df, customers_df, products_df):
+@st.fragment
+def create_order_analysis(customer_filters):
     """Create order analysis visualizations"""
     st.subheader("📦 Order Analysis")
-    
-    # Merge data for analysis
-    orders_with_customers = orders_df.merge(
-        customers_df[['customer_id', 'full_name', 'segment', 'city', 'state']],
-        on='customer_id',
-        how='left'
-    )
+    figures = build_order_figures(customer_filters)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        # Order status distribution
-        status_counts = orders_df['status'].value_counts()
-        fig_status = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Order Status Distribution",
-            color_discrete_sequence=px.colors.qualitative.Set1
-        )
-        fig_status.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_status, use_container_width=True)
+        st.plotly_chart(figures['status'], key='order_status_chart', use_container_width=True)
     
     with col2:
-        # Payment method distribution
-        payment_counts = orders_df['payment_method'].value_counts()
-        fig_payment = px.bar(
-            x=payment_counts.index,
-            y=payment_counts.values,
-            title="Payment Method Distribution",
-            color=payment_counts.values,
-            color_continuous_scale='plasma'
-        )
-        fig_payment.update_layout(xaxis_title="Payment Method", yaxis_title="Count")
-        st.plotly_chart(fig_payment, use_container_width=True)
+        st.plotly_chart(figures['payment'], key='order_payment_chart', use_container_width=True)
     
     # Revenue trends
     st.subheader("📈 Revenue Analysis")
     col1, col2 = st.columns(2)
     
     with col1:
-        # Revenue by segment
-        segment_revenue = orders_with_customers.groupby('segment')['total_amount'].sum().sort_values(ascending=False)
-        fig_segment_rev = px.bar(
-            x=segment_revenue.index,
-            y=segment_revenue.values,
-            title="Revenue by Customer Segment",
-            color=segment_revenue.values,
-            color_continuous_scale='viridis'
-        )
-        fig_segment_rev.update_layout(xaxis_title="Segment", yaxis_title="Revenue ($)")
-        st.plotly_chart(fig_segment_rev, use_container_width=True)
+        st.plotly_chart(figures['segment_revenue'], key='segment_revenue_chart', use_container_width=True)
     
     with col2:
-        # Top spending customers
-        top_customers = customers_df.nlargest(10, 'total_spent')[['full_name', 'total_spent', 'segment']]
-        fig_top_customers = px.bar(
-            top_customers,
-            x='total_spent',
-            y='full_name',
-            orientation='h',
-            title="Top 10 Customers by Total Spent",
-            color='segment',
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig_top_customers.update_layout(xaxis_title="Total Spent ($)", yaxis_title="Customer")
-        st.plotly_chart(fig_top_customers, use_container_width=True)
+        st.plotly_chart(figures['top_customers'], key='top_customers_chart', use_container_width=True)
 
-def create_product_analysis(products_df, orders_df):
+@st.fragment
+def create_product_analysis(product_filters):
     """Create product analysis visualizations"""
     st.subheader("🛍️ Product Analysis")
-    
-    # Merge orders with products for analysis
-    orders_with_products = orders_df.merge(
-        products_df[['product_id', 'product_name', 'category', 'brand', 'price']],
-        on='product_id',
-        how='left'
-    )
+    figures = build_product_figures(product_filters)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        # Product category distribution
-        category_counts = products_df['category'].value_counts()
-        fig_category = px.pie(
-            values=category_counts.values,
-            names=category_counts.index,
-            title="Product Category Distribution",
-            color_discrete_sequence=px.colors.qualitative.Set2
-        )
-        fig_category.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_category, use_container_width=True)
+        st.plotly_chart(figures['category'], key='product_category_chart', use_container_width=True)
     
     with col2:
-        # Product price distribution
-        fig_price = px.histogram(
-            products_df,
-            x='price',
-            nbins=20,
-            title="Product Price Distribution",
-            color_discrete_sequence=['#ff7f0e']
-        )
-        fig_price.update_layout(xaxis_title="Price ($)", yaxis_title="Count")
-        st.plotly_chart(fig_price, use_container_width=True)
+        st.plotly_chart(figures['price'], key='product_price_chart', use_container_width=True)
     
     # Top selling products
     st.subheader("🌟 Top Performing Products")
     col1, col2 = st.columns(2)
     
     with col1:
-        # Top selling products by quantity
-        top_products_qty = orders_with_products.groupby('product_name')['quantity'].sum().nlargest(10)
-        fig_top_qty = px.bar(
-            x=top_products_qty.values,
-            y=top_products_qty.index,
-            orientation='h',
-            title="Top 10 Products by Quantity Sold",
-            color=top_products_qty.values,
-            color_continuous_scale='viridis'
-        )
-        fig_top_qty.update_layout(xaxis_title="Quantity Sold", yaxis_title="Product")
-        st.plotly_chart(fig_top_qty, use_container_width=True)
+        st.plotly_chart(figures['top_quantity'], key='top_quantity_chart', use_container_width=True)
     
     with col2:
-        # Top selling products by revenue
-        top_products_rev = orders_with_products.groupby('product_name')['total_amount'].sum().nlargest(10)
-        fig_top_rev = px.bar(
-            x=top_products_rev.values,
-            y=top_products_rev.index,
-            orientation='h',
-            title="Top 10 Products by Revenue",
-            color=top_products_rev.values,
-            color_continuous_scale='plasma'
-        )
-        fig_top_rev.update_layout(xaxis_title="Revenue ($)", yaxis_title="Product")
-        st.plotly_chart(fig_top_rev, use_container_width=True)
+        st.plotly_chart(figures['top_revenue'], key='top_revenue_chart', use_container_width=True)
+
+@st.cache_data(show_spinner=False)
+def get_missing_counts():
+    """Count rows and missing values in the checked columns of each table"""
+    customers_df, orders_df, products_df = load_data()
+    return {
+        'customers': (len(customers_df), customers_df[['email', 'phone', 'age']].isna().sum()),
+        'orders': (len(orders_df), orders_df[['customer_id', 'product_id', 'total_amount']].isna().sum()),
+        'products': (len(products_df), products_df[['price', 'category', 'stock_quantity']].isna().sum())
+    }
 
-def create_data_quality_insights(customers_df, orders_df, products_df):
+@st.fragment
+def create_data_quality_insights():
     """Create data quality insights"""
     st.subheader("🔍 Data Quality Insights")
+    missing_counts = get_missing_counts()
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
         st.markdown("### Customers Data Quality")
-        total_customers = len(customers_df)
-        missing_email = customers_df['email'].isnull().sum()
-        missing_phone = customers_df['phone'].isnull().sum()
-        missing_age = customers_df['age'].isnull().sum()
+        total_customers, missing = missing_counts['customers']
+        missing_email = missing['email']
+        missing_phone = missing['phone']
+        missing_age = missing['age']
         
         st.metric("Missing Email", f"{missing_email:,} ({missing_email/total_customers*100:.1f}%)")
         st.metric("Missing Phone", f"{missing_phone:,} ({missing_phone/total_customers*100:.1f}%)")
@@ -326,10 +514,10 @@ def create_data_quality_insights(customers_df, orders_df, products_df):
     
     with col2:
         st.markdown("### Orders Data Quality")
-        total_orders = len(orders_df)
-        missing_customer = orders_df['customer_id'].isnull().sum()
-        missing_product = orders_df['product_id'].isnull().sum()
-        missing_amount = orders_df['total_amount'].isnull().sum()
+        total_orders, missing = missing_counts['orders']
+        missing_customer = missing['customer_id']
+        missing_product = missing['product_id']
+        missing_amount = missing['total_amount']
         
         st.metric("Missing Customer ID", f"{missing_customer:,} ({missing_customer/total_orders*100:.1f}%)")
         st.metric("Missing Product ID", f"{missing_product:,} ({missing_product/total_orders*100:.1f}%)")
@@ -337,81 +525,77 @@ def create_data_quality_insights(customers_df, orders_df, products_df):
     
     with col3:
         st.markdown("### Products Data Quality")
-        total_products = len(products_df)
-        missing_price = products_df['price'].isnull().sum()
-        missing_category = products_df['category'].isnull().sum()
-        missing_stock = products_df['stock_quantity'].isnull().sum()
+        total_products, missing = missing_counts['products']
+        missing_price = missing['price']
+        missing_category = missing['category']
+        missing_stock = missing['stock_quantity']
         
         st.metric("Missing Price", f"{missing_price:,} ({missing_price/total_products*100:.1f}%)")
         st.metric("Missing Category", f"{missing_category:,} ({missing_category/total_products*100:.1f}%)")
         st.metric("Missing Stock", f"{missing_stock:,} ({missing_stock/total_products*100:.1f}%)")
 
-def create_interactive_filters(customers_df, orders_df, products_df):
+@st.cache_data(show_spinner=False)
+def get_filter_options():
+    """Collect the sidebar filter choices, which only change when the data does"""
+    customers_df, _, products_df = load_data()
+    return {
+        'status': ['All'] + list(customers_df['status'].unique()),
+        'segment': ['All'] + list(customers_df['segment'].unique()),
+        'gender': ['All'] + list(customers_df['gender'].unique()),
+        'age': (int(customers_df['age'].min()), int(customers_df['age'].max())),
+        'category': ['All'] + list(products_df['category'].unique()),
+        'price': (float(products_df['price'].min()), float(products_df['price'].max()))
+    }
+
+def create_interactive_filters():
     """Create interactive filters"""
+    options = get_filter_options()
     st.sidebar.header("🔎 Filters")
     
     # Customer filters
     st.sidebar.subheader("Customer Filters")
     
     # Status filter
-    status_options = ['All'] + list(customers_df['status'].unique())
-    selected_status = st.sidebar.selectbox("Customer Status", status_options)
+    selected_status = st.sidebar.selectbox("Customer Status", options['status'])
     
     # Segment filter
-    segment_options = ['All'] + list(customers_df['segment'].unique())
-    selected_segment = st.sidebar.selectbox("Customer Segment", segment_options)
+    selected_segment = st.sidebar.selectbox("Customer Segment", options['segment'])
     
     # Gender filter
-    gender_options = ['All'] + list(customers_df['gender'].unique())
-    selected_gender = st.sidebar.selectbox("Gender", gender_options)
+    selected_gender = st.sidebar.selectbox("Gender", options['gender'])
     
     # Age range filter
-    min_age = int(customers_df['age'].min())
-    max_age = int(customers_df['age'].max())
+    min_age, max_age = options['age']
     age_range = st.sidebar.slider("Age Range", min_age, max_age, (min_age, max_age))
     
-    # Apply filters
-    filtered_customers = customers_df.copy()
-    
-    if selected_status != 'All':
-        filtered_customers = filtered_customers[filtered_customers['status'] == selected_status]
-    
-    if selected_segment != 'All':
-        filtered_customers = filtered_customers[filtered_customers['segment'] == selected_segment]
-    
-    if selected_gender != 'All':
-        filtered_customers = filtered_customers[filtered_customers['gender'] == selected_gender]
-    
-    filtered_customers = filtered_customers[
-        (filtered_customers['age'] >= age_range[0]) & 
-        (filtered_customers['age'] <= age_range[1])
-    ]
-    
     # Product filters
     st.sidebar.subheader("Product Filters")
     
     # Category filter
-    category_options = ['All'] + list(products_df['category'].unique())
-    selected_category = st.sidebar.selectbox("Product Category", category_options)
+    selected_category = st.sidebar.selectbox("Product Category", options['category'])
     
     # Price range filter
-    min_price = float(products_df['price'].min())
-    max_price = float(products_df['price'].max())
+    min_price, max_price = options['price']
     price_range = st.sidebar.slider("Price Range ($)", min_price, max_price, (min_price, max_price))
     
-    # Apply product filters
-    filtered_products = products_df.copy()
-    
-    if selected_category != 'All':
-        filtered_products = filtered_products[filtered_products['category'] == selected_category]
-    
-    filtered_products = filtered_products[
-        (filtered_products['price'] >= price_range[0]) & 
-        (filtered_products['price'] <= price_range[1])
-    ]
-    
-    return filtered_customers, filtered_products
+    # Filter values double as cache keys for the figure builders
+    customer_filters = (selected_status, selected_segment, selected_gender, age_range)
+    product_filters = (selected_category, price_range)
+    return customer_filters, product_filters
+
+def show_table_page(df, key):
+    """Show one page of a table so only PAGE_SIZE rows are sent to the browser"""
+    page_count = max(1, -(-len(df) // PAGE_SIZE))
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key=key)
+    start = (page - 1) * PAGE_SIZE
+    st.dataframe(
+        df.iloc[start:start + PAGE_SIZE],
+        use_container_width=True,
+        hide_index=True
+    )
+    st.caption(f"Rows {min(start + 1, len(df)):,}-{min(start + PAGE_SIZE, len(df)):,} of {len(df):,}")
 
+@st.fragment
 def create_data_tables(customers_df, orders_df, products_df):
     """Create interactive data tables"""
     st.subheader("📋 Data Tables")
@@ -419,43 +603,33 @@ def create_data_tables(customers_df, orders_df, products_df):
     tab1, tab2, tab3 = st.tabs(["Customers", "Orders", "Products"])
     
     with tab1:
-        st.dataframe(
-            customers_df,
-            use_container_width=True,
-            hide_index=True
-        )
+        show_table_page(customers_df, 'customers_page')
     
     with tab2:
-        st.dataframe(
-            orders_df,
-            use_container_width=True,
-            hide_index=True
-        )
+        show_table_page(orders_df, 'orders_page')
     
     with tab3:
-        st.dataframe(
-            products_df,
-            use_container_width=True,
-            hide_index=True
-        )
+        show_table_page(products_df, 'products_page')
 
 def main():
     """Main dashboard function"""
     # Load data
-    customers_df, orders_df, products_df, reconciliation_df = load_data()
+    customers_df, orders_df, products_df = load_data()
     
     if customers_df is None:
         st.error("Failed to load data. Please ensure the SQLite database exists.")
         return
     
     # Calculate KPIs
-    kpis = calculate_kpis(customers_df, orders_df, products_df)
+    kpis = load_kpis()
     
     # Display KPIs
     create_kpi_cards(kpis)
     
     # Create filters
-    filtered_customers, filtered_products = create_interactive_filters(customers_df, orders_df, products_df)
+    customer_filters, product_filters = create_interactive_filters()
+    filtered_customers = filter_customers(customers_df, *customer_filters)
+    filtered_products = filter_products(products_df, *product_filters)
     
     # Display filtered data info
     st.sidebar.markdown("---")
@@ -464,10 +638,10 @@ def main():
     st.sidebar.markdown(f"Products: {len(filtered_products):,}")
     
     # Create analysis sections
-    create_customer_analysis(filtered_customers)
-    create_order_analysis(orders_df, filtered_customers, filtered_products)
-    create_product_analysis(filtered_products, orders_df)
-    create_data_quality_insights(customers_df, orders_df, products_df)
+    create_customer_analysis(customer_filters)
+    create_order_analysis(customer_filters)
+    create_product_analysis(product_filters)
+    create_data_quality_insights()
     
     # Create data tables
     create_data_tables(filtered_customers, orders_df, filtered_products)